@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import itertools
+import logging
+import re
+import reprlib
+import sys
+import weakref
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
     from .repl import REPLResult
 
 # Check if rich is available
 try:
-    from rich.console import Console
+    from pygments.lexers import get_lexer_by_name
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.syntax import Syntax
     from rich.text import Text
@@ -16,6 +24,165 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+if RICH_AVAILABLE:
+    # Constant fragments, built once: rich copies appended Text, so sharing them is safe
+    _NL = Text("\n")
+    _OUTPUT_LABEL = Text("Output:", style="bold yellow")
+    _ERRORS_LABEL = Text("Errors:", style="bold red")
+    _VARS_LABEL = Text("Variables:", style="bold magenta")
+    _SUCCESS_STATUS = Text("SUCCESS", style="bold green")
+    _ERROR_STATUS = Text("ERROR", style="bold red")
+
+
+@functools.cache
+def _python_lexer():
+    """Build the pygments Python lexer on first use, so importing the package doesn't load it."""
+    return get_lexer_by_name("python")
+
+
+class _PlainLogger(logging.Logger):
+    """
+    Stand-alone logger replacing ``print`` for plain-text output.
+
+    It is not registered with ``logging.getLogger``, so it never touches the user's
+    logging config, and it ignores ``logging.disable()`` just as ``print`` did:
+    output turned on with ``configure_logging`` is only controlled from there.
+    """
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        return level >= self.level
+
+
+# Stdlib logger used for plain-text output when rich is not installed
+_plain_logger = _PlainLogger("pydantic_ai_rlm.plain", logging.INFO)
+_plain_logger.propagate = False
+
+_SEPARATOR = "=" * 50
+_TRUNCATED_SUFFIX = "\n... (truncated)"
+_NON_SPACE = re.compile(r"\S")
+
+# Names in the REPL namespace that are never shown as user variables
+_EXCLUDED_VARS = frozenset(("context", "json", "re", "os", "collections", "math"))
+_MAX_DISPLAY_VARS = 10
+
+
+class _BoundedRepr(reprlib.Repr):
+    """``reprlib.Repr`` that reports a failing ``__repr__`` as ``<unable to repr>``."""
+
+    def repr_instance(self, x, level):
+        try:
+            s = repr(x)
+        except Exception:
+            return "<unable to repr>"
+        if len(s) > self.maxother:
+            i = max(0, (self.maxother - 3) // 2)
+            j = max(0, self.maxother - 3 - i)
+            s = s[:i] + "..." + s[len(s) - j :]
+        return s
+
+
+# Bounded repr for variable values. Exact builtin containers and strings are truncated
+# while being walked; any other object (DataFrames, arrays, dict/list subclasses) still
+# has its full repr() built before it is shortened.
+_REPR = _BoundedRepr()
+_REPR.maxstring = 60
+_REPR.maxother = 60
+_REPR.maxlist = 4
+_REPR.maxtuple = 4
+_REPR.maxset = 4
+_REPR.maxfrozenset = 4
+_REPR.maxdeque = 4
+_REPR.maxdict = 4
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler that writes to the current ``sys.stdout``, like ``print``."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+def _has_text(text: str) -> bool:
+    """Check for non-whitespace content without copying ``text``."""
+    return bool(text) and not text.isspace()
+
+
+def _clip(text: str, max_length: int, suffix: str = _TRUNCATED_SUFFIX) -> str:
+    """
+    Strip and truncate ``text`` to ``max_length`` characters.
+
+    Skips leading whitespace, then slices before stripping so at most ``max_length``
+    characters are copied, however large the captured output is. ``suffix`` is
+    only added when non-whitespace content was cut off.
+    """
+    if len(text) <= max_length:
+        return text.strip()
+    first = _NON_SPACE.search(text)
+    if first is None:
+        return ""
+    end = first.start() + max_length
+    clipped = text[first.start() : end].rstrip()
+    if _NON_SPACE.search(text, end) is None:
+        return clipped
+    return clipped + suffix
+
+
+def _truncate(text: str, max_length: int, suffix: str = "...") -> str:
+    """Truncate ``text`` to ``max_length`` characters, keeping its whitespace."""
+    head = text[: max_length + 1]
+    return head if len(head) <= max_length else head[:max_length] + suffix
+
+
+class _TruncateFilter(logging.Filter):
+    """
+    Shorten the payload argument of records that are about to be emitted.
+
+    Records opt in with ``extra={"truncate": (index, shorten, max_length)}``, where
+    ``shorten`` is ``_clip`` or ``_truncate`` and is applied to ``record.args[index]``.
+    Running as a handler filter means the work only happens once the level check has passed.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        truncate = getattr(record, "truncate", None)
+        if truncate is not None and isinstance(record.args, tuple):
+            index, shorten, max_length = truncate
+            args = list(record.args)
+            args[index] = shorten(args[index], max_length)
+            record.args = tuple(args)
+        return True
+
+
+def _ensure_plain_handler() -> None:
+    """Attach the stdout handler used for plain-text output, once."""
+    if _plain_logger.handlers:
+        return
+    handler = _StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(_TruncateFilter())
+    _plain_logger.addHandler(handler)
+
+
+class _RenderedVars(NamedTuple):
+    """Formatted variable rows of the last logged result."""
+
+    result: weakref.ref[REPLResult]
+    """Weak reference to the result the rows were built from."""
+
+    rows: list[tuple[str, str, str]]
+    """``(name, type name, value)`` rows for the first displayed variables."""
+
+    count: int
+    """Total number of user variables."""
+
+
+def _noop(_arg: Any) -> None:
+    """Stand-in for the ``log_*`` methods of a disabled logger (each takes one argument)."""
+
 
 class RLMLogger:
     """
@@ -23,14 +190,40 @@ class RLMLogger:
 
     Uses rich for fancy terminal output with syntax highlighting and styled panels.
     Falls back to plain text if rich is not installed.
+
+    When disabled through ``configure_logging``, the public ``log_*`` methods are
+    shadowed on the instance by a no-op so calls skip the formatting code.
     """
 
+    _LOG_METHODS = ("log_code_execution", "log_result", "log_llm_query", "log_llm_response")
+
     def __init__(self, enabled: bool = True):
-        self.enabled = enabled
-        if RICH_AVAILABLE:
-            self.console = Console()
-        else:
-            self.console = None
+        # Created on first enable, so a logger that stays disabled never probes the terminal
+        self.console = None
+        # Variable rows of the last logged result, so re-logging the same result skips the
+        # repr() walk. Only callers that log a result more than once benefit; the toolset logs
+        # each result once. The result is weakly referenced and only formatted rows are kept,
+        # so the cache never keeps the REPL context or user objects alive.
+        self._render_cache: _RenderedVars | None = None
+        self._set_enabled(enabled)
+
+    def _set_enabled(self, value: bool) -> None:
+        """Enable or disable output, swapping the ``log_*`` methods for no-ops when disabled."""
+        self.enabled = value
+        if value and self.console is None:
+            if RICH_AVAILABLE:
+                # Output is pre-styled Text, so skip the auto-highlighter and emoji substitution.
+                # Terminal size and color support are still detected, so piped output stays plain.
+                self.console = Console(highlight=False, emoji=False, log_time=False, log_path=False)
+            else:
+                _ensure_plain_handler()
+        for name in self._LOG_METHODS:
+            if value:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, _noop)
+        if not value:
+            self._render_cache = None
 
     def log_code_execution(self, code: str) -> None:
         """Log the code being executed."""
@@ -38,7 +231,7 @@ class RLMLogger:
             return
 
         if RICH_AVAILABLE and self.console:
-            syntax = Syntax(code, "python", theme="monokai", line_numbers=True)
+            syntax = Syntax(code, _python_lexer(), theme="monokai", line_numbers=True)
             panel = Panel(
                 syntax,
                 title="[bold cyan]Code Execution[/bold cyan]",
@@ -47,11 +240,7 @@ class RLMLogger:
             )
             self.console.print(panel)
         else:
-            print(f"\n{'=' * 50}")
-            print("CODE EXECUTION")
-            print("=" * 50)
-            print(code)
-            print("=" * 50)
+            _plain_logger.info("\n%s\nCODE EXECUTION\n%s\n%s\n%s", _SEPARATOR, _SEPARATOR, code, _SEPARATOR)
 
     def log_result(self, result: REPLResult) -> None:
         """Log the execution result."""
@@ -67,113 +256,115 @@ class RLMLogger:
         """Log result using rich formatting."""
         status, border_style = self._get_status_style(result.success)
         content_parts = self._build_content_parts(result)
-        user_vars = self._get_user_vars(result.locals)
+        rendered = self._render_vars(result)
+
+        self._print_result_panel(content_parts, status, border_style, rendered.rows, rendered.count)
 
-        self._print_result_panel(content_parts, status, border_style, user_vars)
+    def _render_vars(self, result: REPLResult) -> _RenderedVars:
+        """Format the displayed user variables, reusing them if the result was just rendered."""
+        cached = self._render_cache
+        if cached is not None and cached.result() is result:
+            return cached
+
+        var_rows = self._format_var_rows(self._first_user_vars(result.locals))
+        # Only a full first page can have more variables behind it
+        user_var_count = self._count_user_vars(result.locals) if len(var_rows) == _MAX_DISPLAY_VARS else len(var_rows)
+        self._render_cache = _RenderedVars(weakref.ref(result), var_rows, user_var_count)
+        return self._render_cache
 
     def _get_status_style(self, success: bool) -> tuple:
         """Get status text and border style based on success."""
         if success:
-            return Text("SUCCESS", style="bold green"), "green"
-        return Text("ERROR", style="bold red"), "red"
+            return _SUCCESS_STATUS, "green"
+        return _ERROR_STATUS, "red"
 
     def _build_content_parts(self, result: REPLResult) -> list:
         """Build content parts for the result panel."""
         parts = [Text(f"Executed in {result.execution_time:.3f}s", style="dim")]
 
-        if result.stdout.strip():
-            stdout = result.stdout.strip()
-            if len(stdout) > 2000:
-                stdout = stdout[:2000] + "\n... (truncated)"
-            parts.extend([Text("\n"), Text("Output:", style="bold yellow"), Text("\n"), Text(stdout, style="white")])
+        if _has_text(result.stdout):
+            parts.extend([_NL, _OUTPUT_LABEL, _NL, Text(_clip(result.stdout, 2000), style="white")])
 
-        if result.stderr.strip():
-            stderr = result.stderr.strip()
-            if len(stderr) > 1000:
-                stderr = stderr[:1000] + "\n... (truncated)"
-            parts.extend([Text("\n"), Text("Errors:", style="bold red"), Text("\n"), Text(stderr, style="red")])
+        if _has_text(result.stderr):
+            parts.extend([_NL, _ERRORS_LABEL, _NL, Text(_clip(result.stderr, 1000), style="red")])
 
         return parts
 
-    def _get_user_vars(self, locals_dict: dict) -> dict:
-        """Extract user-defined variables from locals."""
-        excluded = ("context", "json", "re", "os", "collections", "math")
-        return {k: v for k, v in locals_dict.items() if not k.startswith("_") and k not in excluded}
+    def _first_user_vars(self, locals_dict: dict, n: int = _MAX_DISPLAY_VARS) -> list[tuple[str, Any]]:
+        """Extract the first ``n`` user-defined variables from locals."""
+        return list(itertools.islice(((k, v) for k, v in locals_dict.items() if not k.startswith("_") and k not in _EXCLUDED_VARS), n))
+
+    def _count_user_vars(self, locals_dict: dict) -> int:
+        """Count user-defined variables in locals without copying them."""
+        return sum(1 for k in locals_dict if not k.startswith("_") and k not in _EXCLUDED_VARS)
 
-    def _print_result_panel(self, content_parts: list, status, border_style: str, user_vars: dict) -> None:
+    def _format_var_rows(self, user_vars: list[tuple[str, Any]]) -> list[tuple[str, str, str]]:
+        """Format user variables as ``(name, type name, value)`` display rows."""
+        return [(name, type(value).__name__, self._format_var_value(value)) for name, value in user_vars]
+
+    def _print_result_panel(
+        self, content_parts: list, status, border_style: str, var_rows: list[tuple[str, str, str]], user_var_count: int
+    ) -> None:
         """Print the result panel and optional variables table."""
         from rich.table import Table
 
-        if user_vars:
-            content_parts.extend([Text("\n"), Text("Variables:", style="bold magenta"), Text("\n")])
-            if len(user_vars) > 10:
-                content_parts.append(Text(f"  ... and {len(user_vars) - 10} more variables\n", style="dim"))
+        if var_rows:
+            content_parts.extend([_NL, _VARS_LABEL, _NL])
+            if user_var_count > _MAX_DISPLAY_VARS:
+                content_parts.append(Text(f"  ... and {user_var_count - _MAX_DISPLAY_VARS} more variables\n", style="dim"))
 
         combined = Text()
         for part in content_parts:
             combined.append(part)
 
         panel = Panel(combined, title=f"[bold]Result: {status}[/bold]", border_style=border_style, padding=(0, 1))
-        self.console.print(panel)
+        renderables = [panel]
 
-        if user_vars:
+        if var_rows:
             var_table = Table(show_header=True, header_style="bold", box=None, padding=(0, 1))
             var_table.add_column("Name", style="cyan")
             var_table.add_column("Type", style="yellow")
             var_table.add_column("Value", style="white", max_width=60)
 
-            for name, value in list(user_vars.items())[:10]:
-                value_str = self._format_var_value(value)
-                var_table.add_row(name, type(value).__name__, value_str)
+            for row in var_rows:
+                var_table.add_row(*row)
+
+            renderables.append(var_table)
 
-            self.console.print(var_table)
+        # Render panel and table in a single console write
+        self.console.print(Group(*renderables))
 
     def _format_var_value(self, value) -> str:
         """Format a variable value for display."""
         try:
-            value_str = repr(value)
-            if len(value_str) > 60:
-                return value_str[:57] + "..."
-            return value_str
+            value_str = _REPR.repr(value)
         except Exception:
             return "<unable to repr>"
+        # Nested containers can still add up past the limit
+        if len(value_str) > 60:
+            return value_str[:57] + "..."
+        return value_str
 
     def _log_result_plain(self, result: REPLResult) -> None:
         """Log result using plain text."""
         status = "SUCCESS" if result.success else "ERROR"
-        print(f"\n{'=' * 50}")
-        print(f"RESULT: {status} (executed in {result.execution_time:.3f}s)")
-        print("=" * 50)
-
-        if result.stdout.strip():
-            print("\nOutput:")
-            stdout = result.stdout.strip()
-            if len(stdout) > 2000:
-                stdout = stdout[:2000] + "\n... (truncated)"
-            print(stdout)
-
-        if result.stderr.strip():
-            print("\nErrors:")
-            stderr = result.stderr.strip()
-            if len(stderr) > 1000:
-                stderr = stderr[:1000] + "\n... (truncated)"
-            print(stderr)
-
-        user_vars = {k: v for k, v in result.locals.items() if not k.startswith("_") and k not in ("context", "json", "re", "os")}
-        if user_vars:
-            print("\nVariables:")
-            for name, value in list(user_vars.items())[:10]:
-                try:
-                    value_str = repr(value)
-                    if len(value_str) > 60:
-                        value_str = value_str[:57] + "..."
-                except Exception:
-                    value_str = "<unable to repr>"
-                print(f"  {name} ({type(value).__name__}): {value_str}")
-            if len(user_vars) > 10:
-                print(f"  ... and {len(user_vars) - 10} more variables")
-
-        print("=" * 50)
+        _plain_logger.info("\n%s\nRESULT: %s (executed in %.3fs)\n%s", _SEPARATOR, status, result.execution_time, _SEPARATOR)
+
+        if _has_text(result.stdout):
+            _plain_logger.info("\nOutput:\n%s", result.stdout, extra={"truncate": (0, _clip, 2000)})
+
+        if _has_text(result.stderr):
+            _plain_logger.info("\nErrors:\n%s", result.stderr, extra={"truncate": (0, _clip, 1000)})
+
+        rendered = self._render_vars(result)
+        if rendered.rows:
+            _plain_logger.info("\nVariables:")
+            for row in rendered.rows:
+                _plain_logger.info("  %s (%s): %s", *row)
+            if rendered.count > _MAX_DISPLAY_VARS:
+                _plain_logger.info("  ... and %d more variables", rendered.count - _MAX_DISPLAY_VARS)
+
+        _plain_logger.info(_SEPARATOR)
 
     def log_llm_query(self, prompt: str) -> None:
         """Log an llm_query call."""
@@ -181,10 +372,8 @@ class RLMLogger:
             return
 
         if RICH_AVAILABLE and self.console:
-            # Truncate long prompts
-            display_prompt = prompt
-            if len(display_prompt) > 500:
-                display_prompt = display_prompt[:500] + "..."
+            # Truncate long prompts, slicing first so the full text is never copied
+            display_prompt = _truncate(prompt, 500)
 
             panel = Panel(
                 Text(display_prompt, style="white"),
@@ -194,14 +383,9 @@ class RLMLogger:
             )
             self.console.print(panel)
         else:
-            print(f"\n{'=' * 50}")
-            print("LLM QUERY")
-            print("=" * 50)
-            display_prompt = prompt
-            if len(display_prompt) > 500:
-                display_prompt = display_prompt[:500] + "..."
-            print(display_prompt)
-            print("=" * 50)
+            _plain_logger.info(
+                "\n%s\nLLM QUERY\n%s\n%s\n%s", _SEPARATOR, _SEPARATOR, prompt, _SEPARATOR, extra={"truncate": (2, _truncate, 500)}
+            )
 
     def log_llm_response(self, response: str) -> None:
         """Log an llm_query response."""
@@ -209,10 +393,8 @@ class RLMLogger:
             return
 
         if RICH_AVAILABLE and self.console:
-            # Truncate long responses
-            display_response = response
-            if len(display_response) > 500:
-                display_response = display_response[:500] + "..."
+            # Truncate long responses, slicing first so the full text is never copied
+            display_response = _truncate(response, 500)
 
             panel = Panel(
                 Text(display_response, style="white"),
@@ -222,28 +404,26 @@ class RLMLogger:
             )
             self.console.print(panel)
         else:
-            print(f"\n{'=' * 50}")
-            print("LLM RESPONSE")
-            print("=" * 50)
-            display_response = response
-            if len(display_response) > 500:
-                display_response = display_response[:500] + "..."
-            print(display_response)
-            print("=" * 50)
+            _plain_logger.info(
+                "\n%s\nLLM RESPONSE\n%s\n%s\n%s", _SEPARATOR, _SEPARATOR, response, _SEPARATOR, extra={"truncate": (2, _truncate, 500)}
+            )
 
 
-# Global logger instance
-_logger: RLMLogger | None = None
+# Global logger instance, created at import and reconfigured in place so every
+# caller always sees the same object
+_logger = RLMLogger(enabled=False)  # Disabled by default
 
 
 def get_logger() -> RLMLogger:
     """Get the global RLM logger instance."""
-    global _logger
-    if _logger is None:
-        _logger = RLMLogger(enabled=False)  # Disabled by default
     return _logger
 
 
+def is_enabled() -> bool:
+    """Check whether logging is enabled, so callers can skip building expensive log arguments."""
+    return _logger.enabled
+
+
 def configure_logging(enabled: bool = True) -> RLMLogger:
     """
     Configure RLM logging.
@@ -265,6 +445,5 @@ def configure_logging(enabled: bool = True) -> RLMLogger:
         result = await run_rlm_analysis(context, query)
         ```
     """
-    global _logger
-    _logger = RLMLogger(enabled=enabled)
+    _logger._set_enabled(enabled)
     return _logger